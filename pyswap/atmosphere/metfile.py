@@ -9,8 +9,9 @@ Functions:
     load_from_knmi: retrieving meteorological data from KNMI API
 """
 
+from functools import lru_cache
 from typing import Optional, Literal
-from pandas import read_csv
+from pandas import DataFrame, read_csv
 from datetime import datetime as dt
 from knmi import get_day_data_dataframe, get_hour_data_dataframe
 from ..core import PySWAPBaseModel
@@ -77,12 +78,31 @@ def load_from_knmi(metfil: str,
     if isinstance(variables, str):
         variables = [variables]
 
+    df = _fetch_knmi(stations=tuple(stations),
+                     variables=tuple(variables),
+                     start=start,
+                     end=end,
+                     frequency=frequency,
+                     inseason=inseason)
+
+    return MetFile(metfil=metfil, content=df.copy())
+
+
+@lru_cache(maxsize=32)
+def _fetch_knmi(stations: tuple,
+                variables: tuple,
+                start: str | dt,
+                end: str | dt,
+                frequency: Literal['day', 'hour'],
+                inseason: bool) -> DataFrame:
+    """Fetch and reformat KNMI data; cached per request, callers must copy."""
+
     get_func = get_day_data_dataframe if frequency == 'day' else get_hour_data_dataframe
 
-    df = get_func(stations=stations,
+    df = get_func(stations=list(stations),
                   start=start,
                   end=end,
-                  variables=variables,
+                  variables=list(variables),
                   inseason=inseason)
 
     # rename some columns
@@ -104,4 +124,4 @@ def load_from_knmi(metfil: str,
     df['WET'] = df['WET'] * \
         0.1 * 24  # the required unit is days
 
-    return MetFile(metfil=metfil, content=df)
+    return df
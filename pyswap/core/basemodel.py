@@ -54,23 +54,21 @@ class PySWAPBaseModel(BaseModel):
         Returns:
             str: Custom model string representation.
         """
-        string = ''
-
-        def formatter(attr, value, string):
+        def formatter(attr, value):
             if attr.startswith('table_') or attr.startswith('list_'):
-                return string + value
+                return value
             else:
-                return string + f'{attr.upper()} = {quote_string(value)}\n'
+                return f'{attr.upper()} = {quote_string(value)}\n'
 
+        parts = []
         for attr, value in self.model_dump(
                 mode='json', exclude_none=True).items():
             if isinstance(value, dict):
-                for k, v in value.items():
-                    string = formatter(k, v, string)
+                parts.extend(formatter(k, v) for k, v in value.items())
             else:
-                string = formatter(attr, value, string)
+                parts.append(formatter(attr, value))
 
-        return string
+        return ''.join(parts)
 
     def _concat_sections(self) -> str:
         """Concatenate a string from individual sections.
@@ -79,9 +77,5 @@ class PySWAPBaseModel(BaseModel):
         models, like DraFile, or Model.
         """
 
-        string = ''
-        for k, v in dict(self).items():
-            if v is None or isinstance(v, str):
-                continue
-            string += v.model_string()
-        return string
+        return ''.join(v.model_string() for v in dict(self).values()
+                       if v is not None and not isinstance(v, str))
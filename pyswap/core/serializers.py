@@ -78,8 +78,4 @@ def quote_string(string) -> str:
 
 def serialize_object_list(list) -> str:
     """Serialize a list of objects to a string."""
-    string = ''
-    for item in list:
-        string += item.model_string()
-
-    return string
+    return ''.join(item.model_string() for item in list)
@@ -81,12 +81,6 @@ class ScheduledIrrigation(PySWAPBaseModel):
 
             * 0 - Pressure head
             * 1 - Water content
-
-        dvs_tc1 (Optional[Table]):
-        dvs_tc2 (Optional[Table]):
-        dvs_tc3 (Optional[Table]):
-        dvs_tc4 (Optional[Table]):
-        dvs_tc5 (Optional[Table]):
     """
     schedule: Literal[0, 1]
     startirr: Optional[DayMonth] = None
@@ -113,27 +107,16 @@ class ScheduledIrrigation(PySWAPBaseModel):
     table_tc7tb: Optional[Table] = None
     table_tc8tb: Optional[Table] = None
 
-    def __post_init__(self) -> None:
-        if self.tcs == 1:
-            self.dvs_tc1 = {'dvs_tc1': [0.0, 2.0],
-                            'Trel': [0.95, 0.95]}
-        elif self.tcs == 2:
-            self.dvs_tc2 = {'dvs_tc2': [0.0, 2.0],
-                            'RAW': [0.95, 0.95]}
-        elif self.tcs == 3:
-            self.dvs_tc3 = {'dvs_tc3': [0.0, 2.0],
-                            'TAW': [0.50, 0.50]}
-        elif self.tcs == 4:
-            self.dvs_tc4 = {'dvs_tc4': [0.0, 2.0],
-                            'DWA': [0.40, 0.40]}
-        elif self.tcs == 5:
-            self.dvs_tc5 = {'dvs_tc5': [0.0, 2.0],
-                            'Value_tc5': [-1000.0, -1000.0]}
-        elif self.tcs == 6:
-            assert self.irgthreshold is not None, "irgthreshold is required when tcs is 6"
-            assert self.tcsfix is not None, "tcsfix is required when tcs is 6"
-            if self.tcsfix:
-                assert self.irgdayfix is not None, "irgdayfix is required when tcsfix is True"
+    @model_validator(mode='after')
+    def _validate_scheduled_irrigation(self) -> 'ScheduledIrrigation':
+        if self.tcs == 6:
+            if self.irgthreshold is None:
+                raise ValueError("irgthreshold is required when tcs is 6")
+            if self.tcsfix is None:
+                raise ValueError("tcsfix is required when tcs is 6")
+            if self.tcsfix and self.irgdayfix is None:
+                raise ValueError("irgdayfix is required when tcsfix is True")
+        return self
 
 
 class Irrigation(PySWAPBaseModel):
@@ -6,6 +6,7 @@ Classes:
 
 from ..core import PySWAPBaseModel
 from ..core import open_file
+from functools import cache
 from typing import Optional, Any
 from pathlib import Path
 import shutil
@@ -25,6 +26,14 @@ import platform
 IS_WINDOWS = platform.system() == 'Windows'
 
 
+@cache
+def _swap_executable() -> str:
+    """Path to the bundled SWAP executable for this platform, resolved once."""
+    if IS_WINDOWS:
+        return str(resources.files("pyswap.libs.swap420-exe").joinpath("swap.exe"))
+    return str(resources.files("pyswap.libs.swap420-linux").joinpath("swap420"))
+
+
 class Model(PySWAPBaseModel):
     """Main class that runs the SWAP model.
 
@@ -89,15 +98,10 @@ class Model(PySWAPBaseModel):
     @staticmethod
     def _copy_executable(tempdir: Path):
         """Copy the appropriate SWAP executable to the temporary directory."""
+        shutil.copy(_swap_executable(), str(tempdir))
         if IS_WINDOWS:
-            exec_path = resources.files(
-                "pyswap.libs.swap420-exe").joinpath("swap.exe")
-            shutil.copy(str(exec_path), str(tempdir))
             print('Copying the windows version of SWAP into temporary directory...')
         else:
-            exec_path = resources.files(
-                "pyswap.libs.swap420-linux").joinpath("swap420")
-            shutil.copy(str(exec_path), str(tempdir))
             print('Copying linux executable into temporary directory...')
 
     @staticmethod
@@ -1,10 +1,16 @@
 """Script reading YAML crop settings files."""
 import os
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import yaml
 from pprint import pprint
 from pydantic import BaseModel, computed_field
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader
 
 LIBDIR: Path = Path('pyswap/libs/WOFOST_crop_parameters').absolute()
 
@@ -15,11 +21,16 @@ def croptypes():
             if file.endswith('.yaml')])
 
 
+@lru_cache(maxsize=32)
+def _load_yaml(path: Path, mtime_ns: int) -> dict:
+    """Parse a crop file; the mtime in the key re-reads edited files."""
+    with path.open('r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
 def read_yaml(fname: str, path: Optional[str] = None) -> str:
-    def read(path: str) -> str:
-        with path.open('r') as f:
-            content = yaml.safe_load(f)
-            return content
+    def read(path: Path) -> dict:
+        return deepcopy(_load_yaml(path, path.stat().st_mtime_ns))
     if not path:
         return WOFOSTCrop(
             yaml_content=read(Path(LIBDIR, fname).with_suffix('.yaml').absolute()))
@@ -36,11 +36,15 @@ class SoilProfile(PySWAPBaseModel):
     table_soilhydrfunc: Optional[Table] = None
 
     @model_validator(mode='after')
-    def _validate_soil_profile(self) -> None:
+    def _validate_soil_profile(self) -> 'SoilProfile':
 
         if self.swsophy == 0:
-            assert self.table_soilhydrfunc is not None, "table_soilhydrfunc is required when swsophy is True"
+            if self.table_soilhydrfunc is None:
+                raise ValueError("table_soilhydrfunc is required when swsophy is True")
         else:
-            assert self.filenamesophy is not None, "filenamesophy is required when swsophy is True"
-        if self.swhyst in range(1, 3):
-            assert self.tau is not None, "tau is required when swhyst is 1 or 2"
+            if self.filenamesophy is None:
+                raise ValueError("filenamesophy is required when swsophy is True")
+        if self.swhyst in (1, 2):
+            if self.tau is None:
+                raise ValueError("tau is required when swhyst is 1 or 2")
+        return self
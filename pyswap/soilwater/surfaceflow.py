@@ -33,12 +33,16 @@ class SurfaceFlow(PySWAPBaseModel):
     table_pondmxtb: Optional[Table] = None
 
     @model_validator(mode='after')
-    def _validate_surface_flow(self) -> None:
+    def _validate_surface_flow(self) -> 'SurfaceFlow':
 
         if self.swpondmx == 0:
-            assert self.pondmx is not None, "pondmx is required when swpondmx is 0"
+            if self.pondmx is None:
+                raise ValueError("pondmx is required when swpondmx is 0")
         else:
-            assert self.table_pondmxtb is not None, "pondmxtb is required when swpondmx is 1"
+            if self.table_pondmxtb is None:
+                raise ValueError("pondmxtb is required when swpondmx is 1")
 
         if self.swrunon == 1:
-            assert self.rufil is not None, "runfil is required when swrunon is 1"
+            if self.rufil is None:
+                raise ValueError("runfil is required when swrunon is 1")
+        return self
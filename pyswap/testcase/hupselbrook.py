@@ -1,9 +1,20 @@
 from datetime import date as dt
+from functools import lru_cache
 import pyswap as ps
 from pathlib import Path
 
 
 def _make_hupselbrook():
+    """Return a fresh copy of the Hupsel Brook test case model.
+
+    The model is built once and cached; each call gets a deep copy so callers
+    can modify it without affecting later calls.
+    """
+    return _build_hupselbrook().model_copy(deep=True)
+
+
+@lru_cache(maxsize=1)
+def _build_hupselbrook():
     # %% Basic settings of the model
 
     meta = ps.Metadata(author="John Doe",
@@ -13,12 +24,12 @@ def _make_hupselbrook():
                        swap_ver="4.2")
 
     simset = ps.GeneralSettings(
-        tstart='2002-01-01',
-        tend='2004-12-31',
+        tstart=dt(2002, 1, 1),
+        tend=dt(2004, 12, 31),
         nprintday=1,
         swmonth=1,
         swyrvar=0,
-        datefix='2004-12-31',
+        datefix=dt(2004, 12, 31),
         swvap=1,
         swblc=1,
         swsba=1,
@@ -324,7 +335,7 @@ def _make_hupselbrook():
     # %% irrigation setup
 
     irrig_events = ps.irrigation.IRRIGATION.create({
-        'IRDATE': ['2002-01-05'],
+        'IRDATE': [dt(2002, 1, 5)],
         'IRDEPTH': [5.0],
         'IRCONC': [1000.0],
         'IRTYPE': [1]}
@@ -1,19 +1,32 @@
 """Loads data from the package resources."""
+from functools import lru_cache
 from importlib import resources
 import pandas as pd
 
+_DATA = resources.files('pyswap.testcase.data')
+
+
+@lru_cache(maxsize=None)
+def _read_csv(fname: str) -> pd.DataFrame:
+    with _DATA.joinpath(fname).open('rb') as f:
+        return pd.read_csv(f, engine='c')
+
+
 def load_csv(fname: str) -> pd.DataFrame:
     """Load a CSV file from the package resources.
 
+    The file is parsed once; each call returns a copy of the cached data.
+
     Args:
         file: Path to the file.
 
     Returns:
         DataFrame: Data from the CSV file.
     """
-    return pd.read_csv(resources.open_text('pyswap.testcase.data', fname))
+    return _read_csv(fname).copy()
 
 
+@lru_cache(maxsize=None)
 def load_txt(fname: str) -> str:
     """Load a text file from the package resources.
 
@@ -23,4 +36,4 @@ def load_txt(fname: str) -> str:
     Returns:
         str: Data from the text file.
     """
-    return resources.read_text('pyswap.testcase.data', fname)
\ No newline at end of file
+    return _DATA.joinpath(fname).read_bytes().decode('utf-8')
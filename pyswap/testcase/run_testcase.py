@@ -1,11 +1,17 @@
-from .hupselbrook import _make_hupselbrook
+from importlib import import_module
 from typing import Literal
 
+# case name -> (module, builder); modules are imported on first use
+_CASES = {
+    'hupselbrook': ('.hupselbrook', '_make_hupselbrook'),
+}
+
 
 def get(case: Literal['hupselbrook']):
-    if case == 'hupselbrook':
-        model = _make_hupselbrook()
-    else:
+    if case not in _CASES:
         raise ValueError(f'provided case ({case}) is not available.')
 
+    module, builder = _CASES[case]
+    model = getattr(import_module(module, __package__), builder)()
+
     return model
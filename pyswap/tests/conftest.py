@@ -0,0 +1,9 @@
+import pytest
+from pyswap import testcase
+
+
+@pytest.fixture(scope='session')
+def hupselbrook_result(tmp_path_factory):
+    """Run the Hupsel Brook test case once and share the result."""
+    model = testcase.get('hupselbrook')
+    return model.run(tmp_path_factory.mktemp('hupselbrook'), silence_warnings=True)
@@ -0,0 +1,30 @@
+import pytest
+import pandas as pd
+from pyswap.atmosphere import metfile
+
+
+def test_load_from_knmi_returns_independent_frames(monkeypatch):
+    # Repeated requests are served from the cache, each as its own copy
+    calls = []
+
+    def fake_get_day_data_dataframe(**kwargs):
+        calls.append(kwargs)
+        return pd.DataFrame({'STN': [283], 'TN': [10], 'TX': [20], 'UG': [80],
+                             'DR': [1], 'FG': [30], 'RH': [5], 'EV24': [4],
+                             'Q': [900]})
+
+    monkeypatch.setattr(metfile, 'get_day_data_dataframe',
+                        fake_get_day_data_dataframe)
+    metfile._fetch_knmi.cache_clear()
+
+    first = metfile.load_from_knmi('283.met', stations='283')
+    first.content.loc[0, 'RAIN'] = -1.0
+    second = metfile.load_from_knmi('283.met', stations='283')
+    metfile._fetch_knmi.cache_clear()
+
+    assert len(calls) == 1
+    assert second.content.loc[0, 'RAIN'] == pytest.approx(0.5)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,31 @@
+import pytest
+from pyswap import testcase
+
+
+def test_get_returns_independent_models():
+    # Changes to one test case model must not leak into the next one
+    model = testcase.get('hupselbrook')
+    model.surfaceflow.pondmx = 99.0
+    model.meteorology.metfile.content.loc[0, 'Rain'] = -1.0
+
+    fresh = testcase.get('hupselbrook')
+
+    assert fresh.surfaceflow.pondmx == 0.2
+    assert fresh.meteorology.metfile.content.loc[0, 'Rain'] != -1.0
+
+
+def test_load_csv_returns_independent_frames():
+    # Changes to one loaded frame must not leak into the next one
+    df = testcase.load_csv('1-hupselbrook/283.csv')
+    expected = df.copy()
+    df.loc[0, 'Rain'] = -1.0
+    df['EXTRA'] = 0
+
+    fresh = testcase.load_csv('1-hupselbrook/283.csv')
+
+    assert 'EXTRA' not in fresh.columns
+    assert fresh.equals(expected)
+
+
+if __name__ == "__main__":
+    pytest.main()